@@ -2,7 +2,8 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+from collections.abc import Callable
+from typing import Any, Final
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
@@ -10,7 +11,7 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -97,6 +98,30 @@ BINARY_SENSORS: tuple[BinarySensorEntityDescription, ...] = (
 )
 
 
+_BINARY_KEYS: Final = frozenset(description.key for description in BINARY_SENSORS)
+
+_TRUTHY: Final = frozenset({"1", "true", "on", "yes"})
+
+
+def _str_to_bool(value: str) -> bool:
+    """Convert a textual status value to a binary sensor state."""
+    return value.lower() in _TRUTHY
+
+
+def _make_converter(value: Any) -> Callable[[Any], bool | None]:
+    """Return the state converter for a key, chosen by its value type.
+
+    A key's parsed type does not change between polls, so this runs once
+    per entity instead of on every state read.
+    """
+    # bool is a subclass of int, so bool() covers both
+    if isinstance(value, (bool, int, float)):
+        return bool
+    if isinstance(value, str):
+        return _str_to_bool
+    return lambda value: None
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -105,18 +130,12 @@ async def async_setup_entry(
     """Set up THZ binary sensors based on a config entry."""
     coordinator: THZDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities: list[THZBinarySensor] = []
-
-    for description in BINARY_SENSORS:
-        # Only add sensor if data is available
-        if coordinator.data and description.key in coordinator.data:
-            entities.append(THZBinarySensor(coordinator, description))
-            _LOGGER.debug("Adding binary sensor: %s", description.key)
-        else:
-            _LOGGER.debug(
-                "Skipping binary sensor %s - not available in data",
-                description.key
-            )
+    available_keys = _BINARY_KEYS & coordinator.available_keys
+    entities = [
+        THZBinarySensor(coordinator, description)
+        for description in BINARY_SENSORS
+        if description.key in available_keys
+    ]
 
     async_add_entities(entities)
     _LOGGER.info("Added %d binary sensors", len(entities))
@@ -137,37 +156,40 @@ class THZBinarySensor(
         description: BinarySensorEntityDescription,
     ) -> None:
         """Initialize the binary sensor."""
-        super().__init__(coordinator)
+        key = description.key
+        super().__init__(coordinator, context=coordinator.register_for_key(key))
         self.entity_description = description
-        self._attr_unique_id = f"{coordinator.entry.entry_id}_{description.key}"
+        self._key = key
+        self._convert: Callable[[Any], bool | None] | None = None
+        self._attr_unique_id = coordinator.unique_id_prefix + key
         self._attr_device_info = coordinator.device_info
+        self._update_from_data()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_from_data()
+        super()._handle_coordinator_update()
+
+    def _update_from_data(self) -> None:
+        """Compute state and availability once per coordinator update."""
+        self._attr_available = (
+            self.coordinator.last_update_success
+            and self._key in self.coordinator.available_keys
+        )
+        if not self._attr_available:
+            self._attr_is_on = None
+            return
 
-    @property
-    def is_on(self) -> bool | None:
-        """Return true if the binary sensor is on."""
-        if self.coordinator.data is None:
-            return None
-
-        value = self.coordinator.data.get(self.entity_description.key)
-
+        value = self.coordinator.data[self._key]
         if value is None:
-            return None
-
-        # Handle different value types
-        if isinstance(value, bool):
-            return value
-        if isinstance(value, (int, float)):
-            return bool(value)
-        if isinstance(value, str):
-            return value.lower() in ("1", "true", "on", "yes")
-
-        return None
+            self._attr_is_on = None
+        else:
+            if self._convert is None:
+                self._convert = _make_converter(value)
+            self._attr_is_on = self._convert(value)
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return (
-            super().available
-            and self.coordinator.data is not None
-            and self.entity_description.key in self.coordinator.data
-        )
+        return self._attr_available
@@ -1,18 +1,28 @@
 """Config flow for THZ Heat Pump integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 from typing import Any
 
-import serial.tools.list_ports
 import voluptuous as vol
 
-from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
+from homeassistant.config_entries import (
+    ConfigEntry,
+    ConfigFlow,
+    ConfigFlowResult,
+    OptionsFlow,
+)
 from homeassistant.const import CONF_NAME
+from homeassistant.core import callback
 
 from .const import (
     CONF_BAUDRATE,
+    CONF_FIRMWARE_VERSION,
     CONF_SERIAL_PORT,
+    CONF_VERIFY_CHECKSUMS,
+    CONNECT_TIMEOUT,
     DEFAULT_BAUDRATE,
     DOMAIN,
 )
@@ -20,32 +30,83 @@ from .thz_protocol import THZConnection, parse_firmware
 
 _LOGGER = logging.getLogger(__name__)
 
+# How long an enumerated port list is reused before scanning again (seconds)
+PORTS_CACHE_TTL = 5.0
+# Kept under its own hass.data key; hass.data[DOMAIN] maps entries to
+# coordinators
+PORTS_CACHE_KEY = f"{DOMAIN}_ports_cache"
+
+# Offered when no serial ports are detected
+DEFAULT_PORTS = ["/dev/ttyUSB0", "/dev/ttyUSB1", "/dev/ttyACM0", "COM1", "COM2", "COM3"]
+
+# Fields of the user step that do not depend on the detected ports, built
+# once at import time
+USER_SCHEMA_FIELDS = {
+    vol.Optional(CONF_BAUDRATE, default=DEFAULT_BAUDRATE): vol.In(
+        [9600, 19200, 38400, 57600, 115200]
+    ),
+    vol.Optional(CONF_NAME): str,
+}
+
 
 def get_serial_ports() -> list[str]:
     """Get available serial ports."""
+    # Imported here so loading the integration doesn't pull in pyserial's
+    # platform specific port enumeration backends
+    import serial.tools.list_ports  # pylint: disable=import-outside-toplevel
+
     ports = []
     for port in serial.tools.list_ports.comports():
         ports.append(port.device)
     return ports
 
 
+def read_firmware_version(conn: THZConnection) -> str | None:
+    """Open the connection, read the firmware version and close it again."""
+    with conn:
+        response = conn.send_command("FD")
+        if response.success and response.data:
+            fw_data = parse_firmware(response.data)
+            return fw_data.get("version", "unknown")
+        return None
+
+
 class THZConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for THZ Heat Pump."""
 
     VERSION = 1
 
+    def __init__(self) -> None:
+        """Initialize the config flow."""
+        self._schema: vol.Schema | None = None
+        self._schema_ports: list[str] | None = None
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> THZOptionsFlow:
+        """Get the options flow for this handler."""
+        return THZOptionsFlow(config_entry)
+
+    async def _async_get_serial_ports(self) -> list[str]:
+        """Get available serial ports, reusing a recent scan.
+
+        The scan is shared by all flows of this hass instance, so starting
+        a new flow or re-rendering the form does not rescan right away.
+        """
+        cached: tuple[float, list[str]] | None = self.hass.data.get(PORTS_CACHE_KEY)
+        if cached is not None and time.monotonic() - cached[0] < PORTS_CACHE_TTL:
+            return cached[1]
+
+        ports = await self.hass.async_add_executor_job(get_serial_ports)
+        self.hass.data[PORTS_CACHE_KEY] = (time.monotonic(), ports)
+        return ports
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Handle the initial step."""
         errors: dict[str, str] = {}
 
-        # Get available serial ports
-        ports = await self.hass.async_add_executor_job(get_serial_ports)
-
-        if not ports:
-            ports = ["/dev/ttyUSB0", "/dev/ttyUSB1", "/dev/ttyACM0", "COM1", "COM2", "COM3"]
-
         if user_input is not None:
             serial_port = user_input[CONF_SERIAL_PORT]
             baudrate = user_input.get(CONF_BAUDRATE, DEFAULT_BAUDRATE)
@@ -53,21 +114,11 @@ class THZConfigFlow(ConfigFlow, domain=DOMAIN):
             # Try to connect and read firmware
             firmware_version = None
             try:
-                def test_connection():
-                    conn = THZConnection(serial_port, baudrate)
-                    conn.connect()
-                    try:
-                        response = conn.read_register("FD")
-                        if response.success and response.data:
-                            fw_data = parse_firmware(response.data)
-                            return fw_data.get("version", "unknown")
-                        return None
-                    finally:
-                        conn.disconnect()
-
-                firmware_version = await self.hass.async_add_executor_job(
-                    test_connection
-                )
+                conn = THZConnection(serial_port, baudrate)
+                async with asyncio.timeout(CONNECT_TIMEOUT):
+                    firmware_version = await self.hass.async_add_executor_job(
+                        read_firmware_version, conn
+                    )
                 _LOGGER.info("Connected to heat pump, firmware: %s", firmware_version)
 
             except Exception as err:
@@ -84,22 +135,55 @@ class THZConfigFlow(ConfigFlow, domain=DOMAIN):
                     data={
                         CONF_SERIAL_PORT: serial_port,
                         CONF_BAUDRATE: baudrate,
+                        CONF_FIRMWARE_VERSION: firmware_version,
                     },
                 )
 
-        # Build schema with detected ports
-        data_schema = vol.Schema(
-            {
-                vol.Required(CONF_SERIAL_PORT): vol.In(ports) if ports else str,
-                vol.Optional(CONF_BAUDRATE, default=DEFAULT_BAUDRATE): vol.In(
-                    [9600, 19200, 38400, 57600, 115200]
-                ),
-                vol.Optional(CONF_NAME): str,
-            }
-        )
+        # Get available serial ports; only needed when the form is shown
+        ports = await self._async_get_serial_ports()
+
+        if not ports:
+            ports = DEFAULT_PORTS
+
+        # Build schema with detected ports, reused while they are unchanged
+        if self._schema is None or ports != self._schema_ports:
+            self._schema = vol.Schema(
+                {
+                    vol.Required(CONF_SERIAL_PORT): vol.In(ports),
+                    **USER_SCHEMA_FIELDS,
+                }
+            )
+            self._schema_ports = ports
 
         return self.async_show_form(
             step_id="user",
-            data_schema=data_schema,
+            data_schema=self._schema,
             errors=errors,
         )
+
+
+class THZOptionsFlow(OptionsFlow):
+    """Handle options for THZ Heat Pump."""
+
+    def __init__(self, config_entry: ConfigEntry) -> None:
+        """Initialize the options flow."""
+        self._entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_VERIFY_CHECKSUMS,
+                        default=self._entry.options.get(CONF_VERIFY_CHECKSUMS, False),
+                    ): bool,
+                }
+            ),
+        )
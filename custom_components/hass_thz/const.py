@@ -1,12 +1,21 @@
 """Constants for the THZ integration."""
+from types import MappingProxyType
 from typing import Final
 
+from homeassistant.const import Platform
+
 DOMAIN: Final = "hass_thz"
 
+PLATFORMS: Final = [Platform.SENSOR, Platform.BINARY_SENSOR]
+
 # Configuration
 CONF_SERIAL_PORT: Final = "serial_port"
 CONF_BAUDRATE: Final = "baudrate"
 CONF_FIRMWARE: Final = "firmware"
+# Firmware version detected from the heat pump during setup
+CONF_FIRMWARE_VERSION: Final = "firmware_version"
+# Option: reject responses whose checksum does not match
+CONF_VERIFY_CHECKSUMS: Final = "verify_checksums"
 
 # Defaults
 DEFAULT_BAUDRATE: Final = 115200
@@ -18,37 +27,49 @@ FIRMWARE_OPTIONS: Final = ["2.06", "2.14", "4.39", "5.39", "5.39technician"]
 # Polling intervals (seconds)
 DEFAULT_SCAN_INTERVAL: Final = 60
 
+# Upper bound for the connection test in the config flow (seconds)
+CONNECT_TIMEOUT: Final = 30
+
+# Registers polled by the coordinator and how often each one is refreshed.
+# Counters and the fault history change slowly, so they are read less often.
+POLL_INTERVALS: Final = {
+    "FB": DEFAULT_SCAN_INTERVAL,  # sGlobal
+    "F4": DEFAULT_SCAN_INTERVAL,  # sHC1
+    "09": 600,  # sHistory
+    "D1": 300,  # sLast
+}
+
 # Protocol constants
 HEADER_GET: Final = "0100"
 HEADER_SET: Final = "0180"
 FOOTER: Final = "1003"
 
-# Operation modes
-OP_MODES: Final = {
-    "1": "standby",
-    "11": "automatic", 
-    "3": "DAYmode",
-    "4": "setback",
-    "5": "DHWmode",
-    "14": "manual",
-    "0": "emergency"
-}
+# Operation modes, keyed by the raw register value
+OP_MODES: Final = MappingProxyType({
+    1: "standby",
+    11: "automatic",
+    3: "DAYmode",
+    4: "setback",
+    5: "DHWmode",
+    14: "manual",
+    0: "emergency"
+})
 
-OP_MODES_HC: Final = {
-    "1": "normal",
-    "2": "setback", 
-    "3": "standby",
-    "4": "restart",
-    "5": "restart"
-}
+OP_MODES_HC: Final = MappingProxyType({
+    1: "normal",
+    2: "setback",
+    3: "standby",
+    4: "restart",
+    5: "restart"
+})
 
-SEASON_MODES: Final = {
-    "01": "winter",
-    "02": "summer"
-}
+SEASON_MODES: Final = MappingProxyType({
+    1: "winter",
+    2: "summer"
+})
 
 # Fault codes mapping
-FAULT_CODES: Final = {
+FAULT_CODES: Final = MappingProxyType({
     0: "n.a.",
     1: "F01_AnodeFault",
     2: "F02_SafetyTempDelimiterEngaged",
@@ -81,4 +102,4 @@ FAULT_CODES: Final = {
     50: "F50_SensorHeatPumpReturn",
     51: "F51_SensorHeatPumpFlow",
     52: "F52_SensorCondenserOutlet"
-}
+})
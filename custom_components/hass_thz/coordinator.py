@@ -1,9 +1,14 @@
 """DataUpdateCoordinator for THZ Heat Pump."""
 from __future__ import annotations
 
+import asyncio
 import logging
+import math
+import threading
+import time
 from datetime import timedelta
-from typing import Any
+from functools import cached_property
+from typing import Any, Final
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
@@ -11,9 +16,11 @@ from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, Upda
 
 from .const import (
     CONF_BAUDRATE,
+    CONF_FIRMWARE_VERSION,
     CONF_SERIAL_PORT,
-    DEFAULT_SCAN_INTERVAL,
+    CONF_VERIFY_CHECKSUMS,
     DOMAIN,
+    POLL_INTERVALS,
 )
 from .thz_protocol import (
     THZConnection,
@@ -24,6 +31,13 @@ from .thz_protocol import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Parser for each polled register, resolved once; None keeps the raw data
+POLLED_PARSERS: Final = {
+    reg: PARSERS.get(REGISTERS[reg].get("parse", "raw"))
+    for reg in POLL_INTERVALS
+    if reg in REGISTERS
+}
+
 
 class THZDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Coordinator to manage data updates from the heat pump."""
@@ -33,40 +47,125 @@ class THZDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         """Initialize the coordinator."""
         self.entry = entry
+        # Prefix for the unique IDs of this entry's entities
+        self.unique_id_prefix: Final = f"{entry.entry_id}_"
         self._connection: THZConnection | None = None
+
+        # Serializes use of the serial link across executor jobs; a timed out
+        # poll keeps running in its worker thread after the await is cancelled
+        self._io_lock = threading.Lock()
         
         # Get configuration
         self._port = entry.data[CONF_SERIAL_PORT]
         self._baudrate = entry.data.get(CONF_BAUDRATE, 115200)
+        self._verify_checksums = entry.options.get(CONF_VERIFY_CHECKSUMS, False)
         
-        # Firmware info (will be populated on first update)
-        self.firmware_version: str | None = None
-        
+        # Firmware info, detected during config flow (older entries: on
+        # first update)
+        self.firmware_version: str | None = entry.data.get(CONF_FIRMWARE_VERSION)
+
+        # Poll implementation; detects the firmware once, then swaps itself
+        # for the steady state read
+        self._read_impl = (
+            self._read_data if self.firmware_version else self._read_data_first
+        )
+
+        # Per-register schedule and last parsed values, so registers with a
+        # longer poll interval keep their values between reads
+        self._next_due: dict[str, float] = dict.fromkeys(POLLED_PARSERS, 0.0)
+        self._register_data: dict[str, dict[str, Any]] = {}
+
+        # Register each data key was read from, used as entity context
+        self._key_registers: dict[str, str] = {}
+
+        # Keys present in the current data, rebuilt once per update so
+        # entities don't probe the data dict themselves
+        self.available_keys: frozenset[str] = frozenset()
+
         super().__init__(
             hass,
             _LOGGER,
             name=f"{DOMAIN}_{entry.entry_id}",
-            update_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+            update_interval=timedelta(seconds=math.gcd(*POLL_INTERVALS.values())),
+            # Skip notifying entities when a poll returns identical values
+            always_update=False,
         )
 
     @property
     def connection(self) -> THZConnection:
         """Get or create the connection instance."""
         if self._connection is None:
-            self._connection = THZConnection(self._port, self._baudrate)
+            self._connection = THZConnection(
+                self._port,
+                self._baudrate,
+                verify_checksums=self._verify_checksums,
+            )
         return self._connection
 
+    def register_for_key(self, key: str) -> str | None:
+        """Return the register a data key is read from."""
+        return self._key_registers.get(key)
+
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from the heat pump."""
+        # Entities subscribe with their register as context. Until the first
+        # entities are added (or if none are enabled yet) read everything.
+        wanted = set(self.async_contexts()) or None
+
+        # pyserial is blocking, so the whole poll cycle (connect, handshakes
+        # and all register reads) runs as one executor job per update.
+        # Cap each poll below the update interval so a stuck port can't pile
+        # up executor jobs.
         try:
-            data = await self.hass.async_add_executor_job(self._fetch_data)
-            return data
+            async with asyncio.timeout(self.update_interval.total_seconds() * 0.8):
+                data = await self.hass.async_add_executor_job(
+                    self._fetch_data, wanted
+                )
+        except TimeoutError as err:
+            raise UpdateFailed("Timeout communicating with heat pump") from err
         except Exception as err:
             _LOGGER.exception("Error fetching data from heat pump")
             raise UpdateFailed(f"Error communicating with heat pump: {err}") from err
 
-    def _fetch_data(self) -> dict[str, Any]:
-        """Fetch data from the heat pump (blocking)."""
+        self.available_keys = frozenset(data)
+        return data
+
+    def _fetch_data(self, wanted: set[str] | None = None) -> dict[str, Any]:
+        """Fetch data from the heat pump (blocking).
+
+        Only registers in wanted are read; None reads all polled registers.
+        """
+        with self._io_lock:
+            return self._read_impl(wanted)
+
+    def _read_data_first(self, wanted: set[str] | None) -> dict[str, Any]:
+        """Read the firmware version, then the due registers.
+
+        Used for entries created before the config flow stored the firmware.
+        """
+        conn = self.connection
+
+        if not conn.is_connected():
+            conn.connect()
+
+        try:
+            response = conn.send_command("FD")
+        except Exception:
+            conn.disconnect()
+            raise
+
+        if response.success and response.data:
+            fw_data = parse_firmware(response.data)
+            self.firmware_version = fw_data.get("version", "unknown")
+            _LOGGER.info("Heat pump firmware: %s", self.firmware_version)
+        else:
+            self.firmware_version = "unknown"
+
+        self._read_impl = self._read_data
+        return self._read_data(wanted)
+
+    def _read_data(self, wanted: set[str] | None) -> dict[str, Any]:
+        """Read and parse the due registers; caller holds the I/O lock."""
         conn = self.connection
         
         if not conn.is_connected():
@@ -75,46 +174,51 @@ class THZDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         data: dict[str, Any] = {}
         
         try:
-            # Read firmware on first run
-            if self.firmware_version is None:
-                response = conn.read_register("FD")
-                if response.success and response.data:
-                    fw_data = parse_firmware(response.data)
-                    self.firmware_version = fw_data.get("version", "unknown")
-                    _LOGGER.info("Heat pump firmware: %s", self.firmware_version)
-                else:
-                    self.firmware_version = "unknown"
-            
-            # Read main registers
-            registers_to_read = ["FB", "F4", "09", "D1"]  # sGlobal, sHC1, sHistory, sLast
-            
-            for reg in registers_to_read:
-                if reg not in REGISTERS:
-                    continue
-                    
-                response = conn.read_register(reg)
-                
+            # Read the registers that are due in this cycle. Ticks (and the
+            # executor job) start a little late, so allow half a tick of
+            # slack; otherwise a register due every tick skips every other.
+            now = time.monotonic()
+            horizon = now + self.update_interval.total_seconds() / 2
+            registers_to_read = [
+                reg
+                for reg, next_due in self._next_due.items()
+                if horizon >= next_due and (wanted is None or reg in wanted)
+            ]
+
+            responses = conn.read_registers(registers_to_read)
+
+            for reg, response in responses.items():
                 if response.success and response.data:
-                    # Get parser for this register
-                    parser_name = REGISTERS[reg].get("parse", "raw")
-                    if parser_name in PARSERS:
-                        parsed = PARSERS[parser_name](response.data)
-                        # Flatten parsed data into main dict
-                        for key, value in parsed.items():
-                            if not key.startswith("parse_"):
-                                data[key] = value
+                    parser = POLLED_PARSERS[reg]
+                    if parser is not None:
+                        parsed = parser(response.data)
+                        # parse_error is the only non-value key parsers emit
+                        parse_error = parsed.pop("parse_error", None)
+                        if parse_error is not None:
+                            _LOGGER.debug(
+                                "Error parsing register %s: %s", reg, parse_error
+                            )
+                        self._register_data[reg] = parsed
                     else:
-                        data[f"{reg}_raw"] = response.data
+                        self._register_data[reg] = {f"{reg}_raw": response.data}
+                    self._key_registers.update(
+                        dict.fromkeys(self._register_data[reg], reg)
+                    )
+                    self._next_due[reg] = now + POLL_INTERVALS[reg]
                 else:
+                    # Only values of registers that are not due carry over;
+                    # drop the stale ones so their entities go unavailable
+                    self._register_data.pop(reg, None)
                     _LOGGER.debug(
                         "Failed to read register %s: %s", 
                         reg, 
                         response.error_message
                     )
-            
-            # Add metadata
-            data["_firmware"] = self.firmware_version
-            
+
+            # Flatten parsed data of all registers into main dict
+            for reg in POLLED_PARSERS:
+                data.update(self._register_data.get(reg, {}))
+
             _LOGGER.debug("Fetched data keys: %s", list(data.keys()))
             return data
             
@@ -126,12 +230,22 @@ class THZDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     async def async_close(self) -> None:
         """Close the connection."""
         if self._connection:
-            await self.hass.async_add_executor_job(self._connection.disconnect)
+            await self.hass.async_add_executor_job(self._disconnect)
             self._connection = None
 
-    @property
+    def _disconnect(self) -> None:
+        """Close the serial port once no poll is using it (blocking)."""
+        with self._io_lock:
+            if self._connection:
+                self._connection.disconnect()
+
+    @cached_property
     def device_info(self) -> dict[str, Any]:
-        """Return device info for the heat pump."""
+        """Return device info for the heat pump.
+
+        Built once and shared by all entities; they are only created after
+        the first refresh, which has read the firmware version.
+        """
         return {
             "identifiers": {(DOMAIN, self._port)},
             "name": "Tecalor THZ / Stiebel Eltron LWZ",
@@ -2,7 +2,8 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+from operator import itemgetter
+from typing import Final
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -18,7 +19,7 @@ from homeassistant.const import (
     UnitOfTime,
     UnitOfVolumeFlowRate,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -31,7 +32,7 @@ _LOGGER = logging.getLogger(__name__)
 # =============================================================================
 # Temperature sensors from sGlobal (FB)
 # =============================================================================
-TEMPERATURE_SENSORS: tuple[SensorEntityDescription, ...] = (
+TEMPERATURE_SENSORS: Final[tuple[SensorEntityDescription, ...]] = (
     SensorEntityDescription(
         key="outsideTemp",
         name="Outside Temperature",
@@ -125,7 +126,7 @@ TEMPERATURE_SENSORS: tuple[SensorEntityDescription, ...] = (
 # =============================================================================
 # Heating circuit sensors from sHC1 (F4)
 # =============================================================================
-HEATING_CIRCUIT_SENSORS: tuple[SensorEntityDescription, ...] = (
+HEATING_CIRCUIT_SENSORS: Final[tuple[SensorEntityDescription, ...]] = (
     SensorEntityDescription(
         key="flowTempSet",
         name="Flow Temperature Setpoint",
@@ -206,7 +207,7 @@ HEATING_CIRCUIT_SENSORS: tuple[SensorEntityDescription, ...] = (
 # =============================================================================
 # Mode sensors from sHC1 (F4) - Text values
 # =============================================================================
-MODE_SENSORS: tuple[SensorEntityDescription, ...] = (
+MODE_SENSORS: Final[tuple[SensorEntityDescription, ...]] = (
     SensorEntityDescription(
         key="seasonModeText",
         name="Season Mode",
@@ -222,7 +223,7 @@ MODE_SENSORS: tuple[SensorEntityDescription, ...] = (
 # =============================================================================
 # Operating hours from sHistory (09)
 # =============================================================================
-HOURS_SENSORS: tuple[SensorEntityDescription, ...] = (
+HOURS_SENSORS: Final[tuple[SensorEntityDescription, ...]] = (
     SensorEntityDescription(
         key="compressorHeatingHours",
         name="Compressor Heating Hours",
@@ -275,7 +276,7 @@ HOURS_SENSORS: tuple[SensorEntityDescription, ...] = (
 # =============================================================================
 # Fan sensors from sGlobal (FB)
 # =============================================================================
-FAN_SENSORS: tuple[SensorEntityDescription, ...] = (
+FAN_SENSORS: Final[tuple[SensorEntityDescription, ...]] = (
     SensorEntityDescription(
         key="inputVentilatorSpeed",
         name="Input Fan Speed",
@@ -309,7 +310,7 @@ FAN_SENSORS: tuple[SensorEntityDescription, ...] = (
 # =============================================================================
 # Pressure sensors from sGlobal (FB)
 # =============================================================================
-PRESSURE_SENSORS: tuple[SensorEntityDescription, ...] = (
+PRESSURE_SENSORS: Final[tuple[SensorEntityDescription, ...]] = (
     SensorEntityDescription(
         key="highPressureSensor",
         name="High Pressure",
@@ -331,7 +332,7 @@ PRESSURE_SENSORS: tuple[SensorEntityDescription, ...] = (
 # =============================================================================
 # Other sensors from sGlobal (FB)
 # =============================================================================
-OTHER_SENSORS: tuple[SensorEntityDescription, ...] = (
+OTHER_SENSORS: Final[tuple[SensorEntityDescription, ...]] = (
     SensorEntityDescription(
         key="flowRate",
         name="Flow Rate",
@@ -355,16 +356,19 @@ OTHER_SENSORS: tuple[SensorEntityDescription, ...] = (
 )
 
 # All sensors combined
-ALL_SENSORS = (
-    TEMPERATURE_SENSORS
-    + HEATING_CIRCUIT_SENSORS
-    + MODE_SENSORS
-    + HOURS_SENSORS
-    + FAN_SENSORS
-    + PRESSURE_SENSORS
-    + OTHER_SENSORS
+ALL_SENSORS: Final[tuple[SensorEntityDescription, ...]] = (
+    *TEMPERATURE_SENSORS,
+    *HEATING_CIRCUIT_SENSORS,
+    *MODE_SENSORS,
+    *HOURS_SENSORS,
+    *FAN_SENSORS,
+    *PRESSURE_SENSORS,
+    *OTHER_SENSORS,
 )
 
+# Sensor descriptions by data key, in definition order
+_SENSOR_BY_KEY = {description.key: description for description in ALL_SENSORS}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -374,18 +378,18 @@ async def async_setup_entry(
     """Set up THZ sensors based on a config entry."""
     coordinator: THZDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities: list[THZSensor] = []
+    available_keys = coordinator.available_keys & _SENSOR_BY_KEY.keys()
+    entities = [
+        THZSensor(coordinator, description)
+        for key, description in _SENSOR_BY_KEY.items()
+        if key in available_keys
+    ]
 
-    for description in ALL_SENSORS:
-        # Only add sensor if data is available
-        if coordinator.data and description.key in coordinator.data:
-            entities.append(THZSensor(coordinator, description))
-            _LOGGER.debug("Adding sensor: %s", description.key)
-        else:
-            _LOGGER.debug(
-                "Skipping sensor %s - not available in data",
-                description.key
-            )
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug(
+            "Skipping sensors not available in data: %s",
+            [key for key in _SENSOR_BY_KEY if key not in available_keys],
+        )
 
     async_add_entities(entities)
     _LOGGER.info("Added %d sensors", len(entities))
@@ -403,24 +407,35 @@ class THZSensor(CoordinatorEntity[THZDataUpdateCoordinator], SensorEntity):
         description: SensorEntityDescription,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        key = description.key
+        super().__init__(coordinator, context=coordinator.register_for_key(key))
         self.entity_description = description
-        self._attr_unique_id = f"{coordinator.entry.entry_id}_{description.key}"
+        self._key = key
+        self._get_value = itemgetter(key)
+        self._attr_unique_id = coordinator.unique_id_prefix + key
         self._attr_device_info = coordinator.device_info
+        self._update_from_data()
 
-    @property
-    def native_value(self) -> Any:
-        """Return the state of the sensor."""
-        if self.coordinator.data is None:
-            return None
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._update_from_data()
+        super()._handle_coordinator_update()
 
-        return self.coordinator.data.get(self.entity_description.key)
+    def _update_from_data(self) -> None:
+        """Compute value and availability once per coordinator update."""
+        try:
+            self._attr_native_value = self._get_value(self.coordinator.data)
+        except (KeyError, TypeError):
+            # Key missing or no data yet
+            self._attr_native_value = None
+
+        self._attr_available = (
+            self.coordinator.last_update_success
+            and self._key in self.coordinator.available_keys
+        )
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return (
-            super().available
-            and self.coordinator.data is not None
-            and self.entity_description.key in self.coordinator.data
-        )
+        return self._attr_available
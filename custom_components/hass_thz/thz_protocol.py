@@ -5,9 +5,11 @@ Based on FHEM's 00_THZ.pm
 
 This module provides the core protocol logic for communicating with THZ heat pumps.
 """
+import struct
 import time
 from dataclasses import dataclass
 from enum import IntEnum
+from functools import lru_cache
 from typing import Any
 
 import serial
@@ -21,7 +23,7 @@ class THZError(IntEnum):
     UNKNOWN_REG = 0x04
 
 
-@dataclass
+@dataclass(slots=True)
 class THZResponse:
     """Response from THZ heat pump."""
     success: bool
@@ -57,24 +59,11 @@ def calculate_checksum(cmd: str) -> int:
     Returns:
         Checksum value (0-255)
     """
-    header = "0100"
-    footer = "1003"
-    template = header + "XX" + cmd + footer
-    
-    checksum = 0
-    data_without_footer = template[:-4]  # Remove "1003"
-    
-    for i in range(0, len(data_without_footer), 2):
-        if i == 4:  # Skip XX placeholder at position 4-5
-            continue
-        byte_hex = data_without_footer[i:i+2]
-        if byte_hex != "XX":
-            checksum += int(byte_hex, 16)
-    
-    return checksum % 256
+    # Header 01 00 plus the command bytes
+    return (0x01 + sum(bytes.fromhex(cmd))) % 256
 
 
-def escape_data(data: str) -> str:
+def escape_bytes(data: bytes) -> bytes:
     """
     Apply escape sequences to data before sending.
     
@@ -82,28 +71,42 @@ def escape_data(data: str) -> str:
     - 0x10 -> 0x10 0x10
     - 0x2B -> 0x2B 0x18
     
+    Neither replacement produces the other's trigger byte, so two C-level
+    replace passes are equivalent to a byte-by-byte scan.
+    
+    Args:
+        data: Raw bytes to escape
+        
+    Returns:
+        Escaped bytes
+    """
+    return data.replace(b"\x10", b"\x10\x10").replace(b"\x2B", b"\x2B\x18")
+
+
+def unescape_bytes(data: bytes) -> bytes:
+    """
+    Remove escape sequences from received data.
+    
+    Args:
+        data: Bytes with escape sequences
+        
+    Returns:
+        Unescaped bytes
+    """
+    return data.replace(b"\x2B\x18", b"\x2B").replace(b"\x10\x10", b"\x10")
+
+
+def escape_data(data: str) -> str:
+    """
+    Apply escape sequences to data before sending.
+    
     Args:
         data: Hex string to escape
         
     Returns:
         Escaped hex string
     """
-    result = ""
-    i = 0
-    while i < len(data):
-        if i + 1 < len(data):
-            two_chars = data[i:i+2]
-            if two_chars == "10":
-                result += "1010"
-                i += 2
-                continue
-            elif two_chars == "2B":
-                result += "2B18"
-                i += 2
-                continue
-        result += data[i]
-        i += 1
-    return result
+    return escape_bytes(bytes.fromhex(data)).hex().upper()
 
 
 def unescape_data(data: str) -> str:
@@ -116,7 +119,27 @@ def unescape_data(data: str) -> str:
     Returns:
         Unescaped hex string
     """
-    return data.replace("1010", "10").replace("2B18", "2B")
+    return unescape_bytes(bytes.fromhex(data)).hex().upper()
+
+
+@lru_cache(maxsize=64)
+def encode_command(register: str) -> bytes:
+    """
+    Build the request frame for a register as bytes.
+    
+    Format: 01 00 + escaped(checksum + register) + 10 03
+    
+    Frames are cached per register, so polling only encodes each one once.
+    
+    Args:
+        register: Register address as hex string (e.g., "FD")
+        
+    Returns:
+        Complete request frame
+    """
+    cmd = bytes.fromhex(register)
+    checksum = (0x01 + sum(cmd)) % 256
+    return b"\x01\x00" + escape_bytes(bytes((checksum,)) + cmd) + b"\x10\x03"
 
 
 def build_command(register: str) -> str:
@@ -131,41 +154,145 @@ def build_command(register: str) -> str:
     Returns:
         Complete command as hex string
     """
-    checksum = calculate_checksum(register)
-    data_to_escape = f"{checksum:02X}" + register
-    escaped = escape_data(data_to_escape)
-    return "0100" + escaped + "1003"
+    return encode_command(register).hex().upper()
 
 
-def parse_response(data_hex: str) -> THZResponse:
+# Handshake control bytes
+STX = b"\x02"
+DLE = b"\x10"
+# Response footer (DLE ETX)
+FOOTER = b"\x10\x03"
+
+
+def footer_escaped(data: bytes | bytearray) -> bool:
     """
-    Parse a raw response from the heat pump.
+    Check whether data ends in 10 03 where the 10 is escaped payload.
+    
+    A payload 0x10 is sent as 10 10, so a 10 03 at the end of the data is
+    only the footer if it is preceded by an odd number of 0x10 bytes.
     
     Args:
-        data_hex: Raw response as hex string
+        data: Raw (escaped) bytes read so far
+        
+    Returns:
+        True if more data has to be read to reach the real footer
+    """
+    if not data.endswith(FOOTER):
+        return False
+    body = data[:-1]
+    return (len(body) - len(body.rstrip(DLE))) % 2 == 0
+
+
+def verify_checksum(frame: bytes | bytearray) -> bool:
+    """
+    Check the checksum of an unescaped response frame.
+    
+    The checksum (byte 2) is the sum of all other bytes except the 10 03
+    footer, modulo 256.
+    
+    Args:
+        frame: Unescaped response bytes
+        
+    Returns:
+        True if the checksum matches
+    """
+    checksum = frame[2]
+    return (sum(memoryview(frame)[:-2]) - checksum) % 256 == checksum
+
+
+def decode_response(frame: bytes | bytearray, check: bool = False) -> THZResponse:
+    """
+    Decode a raw response frame from the heat pump.
+    
+    Args:
+        frame: Raw (escaped) response bytes
+        check: Verify the checksum of successful responses
         
     Returns:
         THZResponse object
     """
-    if not data_hex or len(data_hex) < 8:
+    if len(frame) < 4:
         return THZResponse(success=False, error_message="Response too short")
     
     # Unescape first
-    data_hex = unescape_data(data_hex.upper())
+    frame = unescape_bytes(frame)
+    
+    header = frame[:2]
     
-    header = data_hex[:4]
+    # Reject corrupted success frames before any payload is extracted
+    if check and header == b"\x01\x00" and not verify_checksum(frame):
+        return THZResponse(success=False, error=THZError.CRC_ERROR, error_message="Checksum mismatch")
     
-    if header == "0100":
-        # Success - extract data: 0100 + checksum(2) + data + 1003
-        return THZResponse(success=True, data=data_hex[6:-4])
-    elif header == "0102":
+    if header == b"\x01\x00":
+        # Success - extract data: 01 00 + checksum + data + 10 03. Slice
+        # through a view so the payload is only copied into its hex string
+        return THZResponse(success=True, data=memoryview(frame)[3:-2].hex().upper())
+    elif header == b"\x01\x02":
         return THZResponse(success=False, error=THZError.CRC_ERROR, error_message="CRC Error")
-    elif header == "0103":
+    elif header == b"\x01\x03":
         return THZResponse(success=False, error=THZError.UNKNOWN_CMD, error_message="Unknown command")
-    elif header == "0104":
+    elif header == b"\x01\x04":
         return THZResponse(success=False, error=THZError.UNKNOWN_REG, error_message="Unknown register")
     else:
-        return THZResponse(success=False, error_message=f"Unknown header: {header}")
+        return THZResponse(success=False, error_message=f"Unknown header: {header.hex().upper()}")
+
+
+def parse_response(data_hex: str) -> THZResponse:
+    """
+    Parse a raw response from the heat pump.
+    
+    Args:
+        data_hex: Raw response as hex string
+        
+    Returns:
+        THZResponse object
+    """
+    if not data_hex or len(data_hex) < 8:
+        return THZResponse(success=False, error_message="Response too short")
+    
+    return decode_response(bytes.fromhex(data_hex))
+
+
+# Big-endian field decoders for register payloads, shared by the parsers
+_U8 = struct.Struct(">B")
+_U16 = struct.Struct(">H")
+_S16 = struct.Struct(">h")
+
+
+def _compile_layout(
+    *fields: tuple[str, int, struct.Struct, int | None],
+) -> tuple[tuple[str, int, int, struct.Struct, int | None], ...]:
+    """
+    Compile a register layout into a decode plan.
+    
+    Args:
+        fields: (name, hex position after the command echo, decoder, divisor)
+        
+    Returns:
+        Tuple of (name, byte offset, required length, decoder, divisor),
+        ordered by required length
+    """
+    plan = []
+    for name, hex_pos, decoder, divisor in fields:
+        offset = hex_pos // 2 + 1  # +1 skips the command echo byte
+        plan.append((name, offset, offset + decoder.size, decoder, divisor))
+    return tuple(sorted(plan, key=lambda field: field[2]))
+
+
+def _decode_layout(data_hex: str, plan: tuple) -> dict[str, Any]:
+    """Decode the fields of a compiled layout that fit in the payload."""
+    result = {}
+    try:
+        data = bytes.fromhex(data_hex)
+        n = len(data)
+        for name, offset, required, decoder, divisor in plan:
+            if n < required:
+                break
+            value = decoder.unpack_from(data, offset)[0]
+            result[name] = value / divisor if divisor else value
+    except (ValueError, IndexError, struct.error) as e:
+        result["parse_error"] = str(e)
+    return result
 
 
 def parse_temp(hex_val: str, signed: bool = True) -> float:
@@ -179,6 +306,9 @@ def parse_temp(hex_val: str, signed: bool = True) -> float:
     Returns:
         Temperature in degrees Celsius
     """
+    if len(hex_val) == 4:
+        return (_S16 if signed else _U16).unpack(bytes.fromhex(hex_val))[0] / 10
+    # Other lengths keep the int() parse with a 16-bit sign check
     val = int(hex_val, 16)
     if signed and val > 32767:
         val = val - 65536
@@ -189,18 +319,35 @@ def parse_firmware(data_hex: str) -> dict[str, Any]:
     """Parse firmware register (FD)."""
     result = {}
     try:
-        if len(data_hex) >= 6:
-            version_hex = data_hex[2:6]
-            version_raw = int(version_hex, 16)
-            major = version_raw // 100
-            minor = version_raw % 100
+        data = bytes.fromhex(data_hex)
+        if len(data) >= 3:
+            version_raw = _U16.unpack_from(data, 1)[0]
+            major, minor = divmod(version_raw, 100)
             result["version"] = f"{major}.{minor:02d}"
             result["version_raw"] = version_raw
-    except (ValueError, IndexError) as e:
+    except (ValueError, IndexError, struct.error) as e:
         result["parse_error"] = str(e)
     return result
 
 
+# sGlobal (FB) status flags: (name, byte offset incl. command echo, mask)
+SGLOBAL_FLAGS = (
+    # byte44 (0x17 = 0b00010111): compressor and boosters
+    ("compressor", 23, 0x01),
+    ("boosterStage1", 23, 0x02),
+    ("boosterStage2", 23, 0x04),
+    ("boosterStage3", 23, 0x08),
+    # byte42 (0x08 = 0b00001000): pumps and valves
+    ("heatingCircuitPump", 22, 0x01),
+    ("dhwPump", 22, 0x02),
+    ("diverterValve", 22, 0x04),
+    ("heatPipeValve", 22, 0x08),
+    # byte40: mixer status
+    ("mixerClosed", 21, 0x01),
+    ("mixerOpen", 21, 0x02),
+)
+
+
 def parse_sglobal(data_hex: str) -> dict[str, Any]:
     """
     Parse sGlobal (FB) register - main sensor data.
@@ -231,73 +378,74 @@ def parse_sglobal(data_hex: str) -> dict[str, Any]:
     """
     result = {}
     try:
-        d = data_hex[2:]  # Skip command echo (FB)
-        
-        # Temperatures (each 4 hex chars = 2 bytes, signed, /10 for °C)
-        if len(d) >= 4:
-            temp = parse_temp(d[0:4])
+        # Decode once; byte offsets below are hex positions / 2, +1 for
+        # the command echo (FB)
+        data = bytes.fromhex(data_hex)
+        n = len(data) - 1
+        
+        # Temperatures (each 2 bytes, signed, /10 for °C)
+        if n >= 2:
+            temp = _S16.unpack_from(data, 1)[0] / 10
             if temp > -100:  # Valid sensor
                 result["collectorTemp"] = temp
-        if len(d) >= 8:
-            result["outsideTemp"] = parse_temp(d[4:8])
-        if len(d) >= 12:
-            result["flowTemp"] = parse_temp(d[8:12])
-        if len(d) >= 16:
-            result["returnTemp"] = parse_temp(d[12:16])
-        if len(d) >= 20:
-            result["hotGasTemp"] = parse_temp(d[16:20])
-        if len(d) >= 24:
-            result["dhwTemp"] = parse_temp(d[20:24])
-        if len(d) >= 28:
-            temp = parse_temp(d[24:28])
+        if n >= 4:
+            result["outsideTemp"] = _S16.unpack_from(data, 3)[0] / 10
+        if n >= 6:
+            result["flowTemp"] = _S16.unpack_from(data, 5)[0] / 10
+        if n >= 8:
+            result["returnTemp"] = _S16.unpack_from(data, 7)[0] / 10
+        if n >= 10:
+            result["hotGasTemp"] = _S16.unpack_from(data, 9)[0] / 10
+        if n >= 12:
+            result["dhwTemp"] = _S16.unpack_from(data, 11)[0] / 10
+        if n >= 14:
+            temp = _S16.unpack_from(data, 13)[0] / 10
             if temp > -1000:  # 0x8001 = -32767 = not installed
                 result["flowTempHC2"] = temp
-        if len(d) >= 32:
-            inside = parse_temp(d[28:32])
-            if inside > -60:  # 0xFDA8 = -60.0 = no sensor
+        if n >= 16:
+            inside = _S16.unpack_from(data, 15)[0] / 10
+            valid = inside > -60  # 0xFDA8 = -60.0 = no sensor
+            result["insideTempValid"] = valid
+            if valid:
                 result["insideTemp"] = inside
-        if len(d) >= 36:
-            result["evaporatorTemp"] = parse_temp(d[32:36])
-        if len(d) >= 40:
-            result["condenserTemp"] = parse_temp(d[36:40])
+        if n >= 18:
+            result["evaporatorTemp"] = _S16.unpack_from(data, 17)[0] / 10
+        if n >= 20:
+            result["condenserTemp"] = _S16.unpack_from(data, 19)[0] / 10
         
         # Status bytes at position 40-47 (single bytes)
         # Real data shows: pos 40=0x10, 42=0x08, 44=0x17, 46=0x00
-        if len(d) >= 48:
-            byte40 = int(d[40:42], 16)
-            byte42 = int(d[42:44], 16)
-            byte44 = int(d[44:46], 16)
-            byte46 = int(d[46:48], 16)
-            
-            # Based on FHEM documentation and real data analysis:
-            # byte44 (0x17 = 0b00010111): compressor and boosters
-            result["compressor"] = (byte44 & 0x01) != 0
-            result["boosterStage1"] = (byte44 & 0x02) != 0
-            result["boosterStage2"] = (byte44 & 0x04) != 0
-            result["boosterStage3"] = (byte44 & 0x08) != 0
-            
-            # byte42 (0x08 = 0b00001000): pumps and valves
-            result["heatingCircuitPump"] = (byte42 & 0x01) != 0
-            result["dhwPump"] = (byte42 & 0x02) != 0
-            result["diverterValve"] = (byte42 & 0x04) != 0
-            result["heatPipeValve"] = (byte42 & 0x08) != 0
-            
-            # byte40: mixer status
-            result["mixerClosed"] = (byte40 & 0x01) != 0
-            result["mixerOpen"] = (byte40 & 0x02) != 0
+        if n >= 24:
+            for name, offset, mask in SGLOBAL_FLAGS:
+                result[name] = (data[offset] & mask) != 0
         
         # Ventilator data - check FHEM for exact positions
         # From real data: pos 72-73 = 0x39 (57), pos 82-83 = 0x03, pos 84-85 = 0x2A (42)
         # These seem to be ventilator speeds/power
-        if len(d) >= 74:
-            result["mainVentilatorPower"] = int(d[72:74], 16)
+        if n >= 37:
+            result["mainVentilatorPower"] = data[37]
             
-    except (ValueError, IndexError) as e:
+    except (ValueError, IndexError, struct.error) as e:
         result["parse_error"] = str(e)
     
     return result
 
 
+# sHC1 (F4) fields: (name, hex position, decoder, divisor)
+SHC1_LAYOUT = _compile_layout(
+    ("hc1OutsideTemp", 0, _S16, 10),
+    ("hc1ReturnTemp", 8, _S16, 10),
+    ("hc1FlowTemp", 16, _S16, 10),
+    ("heatSetTemp", 24, _S16, 10),
+    ("heatTemp", 28, _S16, 10),
+    ("onHysteresisNo", 32, _U8, None),
+    ("offHysteresisNo", 34, _U8, None),
+    ("roomSetTemp", 52, _S16, 10),
+    ("insideTempRC", 64, _S16, 10),
+    ("onOffCycles", 76, _U16, None),
+)
+
+
 def parse_shc1(data_hex: str) -> dict[str, Any]:
     """
     Parse sHC1 (F4) register - heating circuit 1.
@@ -317,51 +465,11 @@ def parse_shc1(data_hex: str) -> dict[str, Any]:
     - 64-67: insideTempRC (20.5°C) - 0x00CD = 205 / 10
     - 76-79: onOffCycles (23)
     """
-    result = {}
-    try:
-        d = data_hex[2:]  # Skip command echo (F4)
-        
-        # outsideTemp at position 0-3
-        if len(d) >= 4:
-            result["hc1OutsideTemp"] = parse_temp(d[0:4])
-            
-        # returnTemp at position 8-11
-        if len(d) >= 12:
-            result["hc1ReturnTemp"] = parse_temp(d[8:12])
-        
-        # flowTemp at position 16-19
-        if len(d) >= 20:
-            result["hc1FlowTemp"] = parse_temp(d[16:20])
-            
-        # heatSetTemp at position 24-27
-        if len(d) >= 28:
-            result["heatSetTemp"] = parse_temp(d[24:28])
-            
-        # heatTemp at position 28-31
-        if len(d) >= 32:
-            result["heatTemp"] = parse_temp(d[28:32])
-        
-        # Hysteresis numbers at 32-33, 34-35
-        if len(d) >= 36:
-            result["onHysteresisNo"] = int(d[32:34], 16)
-            result["offHysteresisNo"] = int(d[34:36], 16)
-        
-        # roomSetTemp at position 52-55 (0x00CD = 205 / 10 = 20.5°C)
-        if len(d) >= 56:
-            result["roomSetTemp"] = parse_temp(d[52:56])
-            
-        # insideTempRC at position 64-67 (0x00CD = 205 / 10 = 20.5°C)
-        if len(d) >= 68:
-            result["insideTempRC"] = parse_temp(d[64:68])
-            
-        # On/off cycles at position 76-79
-        if len(d) >= 80:
-            result["onOffCycles"] = int(d[76:80], 16)
-            
-    except (ValueError, IndexError) as e:
-        result["parse_error"] = str(e)
-    
-    return result
+    return _decode_layout(data_hex, SHC1_LAYOUT)
+
+
+# dhwOpMode values of the sDHW register, indexed by mode (0 is unused)
+DHW_OP_MODES = (None, "normal", "setback", "standby", "restart", "restart")
 
 
 def parse_dhw(data_hex: str) -> dict[str, Any]:
@@ -385,71 +493,76 @@ def parse_dhw(data_hex: str) -> dict[str, Any]:
     """
     result = {}
     try:
-        d = data_hex[2:]  # Skip command echo (F3)
+        # Decode once; byte offset = hex position / 2 + 1 (command echo F3)
+        data = bytes.fromhex(data_hex)
+        n = len(data) - 1
         
         # dhwTemp at position 0-3 (current DHW temperature)
-        if len(d) >= 4:
-            result["dhwTemp"] = parse_temp(d[0:4])
+        if n >= 2:
+            result["dhwTemp"] = _S16.unpack_from(data, 1)[0] / 10
             
         # outsideTemp at position 4-7
-        if len(d) >= 8:
-            result["dhwOutsideTemp"] = parse_temp(d[4:8])
+        if n >= 4:
+            result["dhwOutsideTemp"] = _S16.unpack_from(data, 3)[0] / 10
             
         # dhwSetTemp at position 8-11 (target temperature)
-        if len(d) >= 12:
-            result["dhwSetTemp"] = parse_temp(d[8:12])
+        if n >= 6:
+            result["dhwSetTemp"] = _S16.unpack_from(data, 5)[0] / 10
             
         # compBlockTime at position 12-15 (compressor block time in minutes)
-        if len(d) >= 16:
-            val = int(d[12:16], 16)
-            if val > 32767:
-                val = val - 65536
-            result["dhwCompBlockTime"] = val
+        if n >= 8:
+            result["dhwCompBlockTime"] = _S16.unpack_from(data, 7)[0]
             
         # dhwBoosterStage at position 24-25
-        if len(d) >= 26:
-            result["dhwBoosterStage"] = int(d[24:26], 16)
+        if n >= 13:
+            result["dhwBoosterStage"] = data[13]
             
         # pasteurisationMode at position 28-29
-        if len(d) >= 30:
-            mode_byte = int(d[28:30], 16)
+        if n >= 15:
+            mode_byte = data[15]
             result["pasteurisationMode"] = mode_byte
             result["pasteurisationActive"] = mode_byte == 1
             
         # dhwOpMode at position 30-31
-        if len(d) >= 32:
-            op_mode = int(d[30:32], 16)
+        if n >= 16:
+            op_mode = data[16]
             result["dhwOpMode"] = op_mode
-            modes = {1: "normal", 2: "setback", 3: "standby", 4: "restart", 5: "restart"}
-            result["dhwOpModeText"] = modes.get(op_mode, str(op_mode))
+            text = DHW_OP_MODES[op_mode] if op_mode < len(DHW_OP_MODES) else None
+            result["dhwOpModeText"] = text or str(op_mode)
             
-    except (ValueError, IndexError) as e:
+    except (ValueError, IndexError, struct.error) as e:
         result["parse_error"] = str(e)
     
     return result
 
 
+# p01-p12 (17 / 0A17) fields
+P01_LAYOUT = _compile_layout(
+    ("p01RoomTempDay", 0, _U16, 10),
+    ("p02RoomTempNight", 4, _U16, 10),
+    ("p04DHWsetTempDay", 12, _U16, 10),
+    ("p07FanStageDay", 24, _U8, None),
+    ("p08FanStageNight", 26, _U8, None),
+)
+
+
 def parse_p01(data_hex: str) -> dict[str, Any]:
     """Parse p01-p12 register (17) - setpoints."""
-    result = {}
-    try:
-        d = data_hex[2:]  # Skip command echo
-        
-        if len(d) >= 4:
-            result["p01RoomTempDay"] = int(d[0:4], 16) / 10
-        if len(d) >= 8:
-            result["p02RoomTempNight"] = int(d[4:8], 16) / 10
-        if len(d) >= 16:
-            result["p04DHWsetTempDay"] = int(d[12:16], 16) / 10
-        if len(d) >= 28:
-            result["p07FanStageDay"] = int(d[24:26], 16)
-        if len(d) >= 30:
-            result["p08FanStageNight"] = int(d[26:28], 16)
-            
-    except (ValueError, IndexError) as e:
-        result["parse_error"] = str(e)
-    
-    return result
+    return _decode_layout(data_hex, P01_LAYOUT)
+
+
+# sHistory (09) fields
+HISTORY_LAYOUT = _compile_layout(
+    # Operating hours
+    ("compressorHeatingHours", 0, _U16, None),
+    ("compressorCoolingHours", 4, _U16, None),
+    ("compressorDHWHours", 8, _U16, None),
+    ("boosterDHWHours", 12, _U16, None),
+    ("boosterHeatingHours", 16, _U16, None),
+    # Additional statistics
+    ("compressorHeatingStarts", 20, _U16, None),
+    ("compressorCoolingStarts", 24, _U16, None),
+)
 
 
 def parse_history(data_hex: str) -> dict[str, Any]:
@@ -458,32 +571,7 @@ def parse_history(data_hex: str) -> dict[str, Any]:
     
     30 bytes = 15 hex pairs after command echo.
     """
-    result = {}
-    try:
-        d = data_hex[2:]  # Skip command echo (09)
-        
-        # Operating hours (each 4 hex = 2 bytes = hours)
-        if len(d) >= 4:
-            result["compressorHeatingHours"] = int(d[0:4], 16)
-        if len(d) >= 8:
-            result["compressorCoolingHours"] = int(d[4:8], 16)
-        if len(d) >= 12:
-            result["compressorDHWHours"] = int(d[8:12], 16)
-        if len(d) >= 16:
-            result["boosterDHWHours"] = int(d[12:16], 16)
-        if len(d) >= 20:
-            result["boosterHeatingHours"] = int(d[16:20], 16)
-            
-        # Additional statistics
-        if len(d) >= 24:
-            result["compressorHeatingStarts"] = int(d[20:24], 16)
-        if len(d) >= 28:
-            result["compressorCoolingStarts"] = int(d[24:28], 16)
-            
-    except (ValueError, IndexError) as e:
-        result["parse_error"] = str(e)
-    
-    return result
+    return _decode_layout(data_hex, HISTORY_LAYOUT)
 
 
 def parse_time(data_hex: str) -> dict[str, Any]:
@@ -502,43 +590,39 @@ def parse_time(data_hex: str) -> dict[str, Any]:
     """
     result = {}
     try:
-        d = data_hex[2:]  # Skip command echo (FC)
-        
-        if len(d) >= 2:
-            result["weekday"] = int(d[0:2], 16)
-        if len(d) >= 4:
-            result["hour"] = int(d[2:4], 16)
-        if len(d) >= 6:
-            result["minute"] = int(d[4:6], 16)
-        if len(d) >= 8:
-            result["second"] = int(d[6:8], 16)  # Might be something else
-        if len(d) >= 10:
-            year_short = int(d[8:10], 16)
-            result["year"] = 2000 + year_short
-        if len(d) >= 12:
-            result["month"] = int(d[10:12], 16)
-        if len(d) >= 14:
-            result["day"] = int(d[12:14], 16)
+        data = bytes.fromhex(data_hex)
+        n = len(data)
+        
+        if n >= 2:
+            result["weekday"] = data[1]
+        if n >= 3:
+            result["hour"] = data[2]
+        if n >= 4:
+            result["minute"] = data[3]
+        if n >= 5:
+            result["second"] = data[4]  # Might be something else
+        if n >= 6:
+            result["year"] = 2000 + data[5]
+        if n >= 7:
+            result["month"] = data[6]
+        if n >= 8:
+            result["day"] = data[7]
             
-    except (ValueError, IndexError) as e:
+    except (ValueError, IndexError, struct.error) as e:
         result["parse_error"] = str(e)
     
     return result
 
 
+# sLast (D1) fields
+ERRORS_LAYOUT = _compile_layout(
+    ("numberOfFaults", 0, _U8, None),
+)
+
+
 def parse_errors(data_hex: str) -> dict[str, Any]:
     """Parse sLast (D1) register - error history."""
-    result = {}
-    try:
-        d = data_hex[2:]  # Skip command echo
-        
-        if len(d) >= 2:
-            result["numberOfFaults"] = int(d[0:2], 16)
-            
-    except (ValueError, IndexError) as e:
-        result["parse_error"] = str(e)
-    
-    return result
+    return _decode_layout(data_hex, ERRORS_LAYOUT)
 
 
 # Parser registry
@@ -562,6 +646,10 @@ class THZConnection:
     - Step 0: Send STX (0x02) -> Expect DLE (0x10)
     - Step 1: Send command -> Expect DLE STX (0x10 0x02)
     - Step 2: Send DLE (0x10) -> Read response data
+    
+    Response checksums are only verified with verify_checksums=True (the
+    "verify checksums" option of the integration) until the check has been
+    confirmed against frames from more heat pumps (see the live tests).
     """
     
     def __init__(
@@ -570,11 +658,13 @@ class THZConnection:
         baudrate: int = 115200,
         timeout: float = 3.0,
         write_timeout: float = 2.0,
+        verify_checksums: bool = False,
     ):
         self.port = port
         self.baudrate = baudrate
         self.timeout = timeout
         self.write_timeout = write_timeout
+        self.verify_checksums = verify_checksums
         self._serial: serial.Serial | None = None
     
     def connect(self) -> None:
@@ -615,66 +705,85 @@ class THZConnection:
         if not self._serial:
             return THZResponse(success=False, error_message="Not connected")
         
-        cmd = build_command(register)
+        frame = encode_command(register)
         
         # Clear buffers
         self._serial.reset_input_buffer()
         self._serial.reset_output_buffer()
         
+        # Handshake bytes are read with blocking reads; pyserial waits in the
+        # OS for the byte (up to the port timeout) instead of sleep/polling
+        
         # Step 0: Send STX
-        self._serial.write(bytes.fromhex("02"))
+        self._serial.write(STX)
         self._serial.flush()
-        time.sleep(0.1)
         
-        response = self._serial.read(self._serial.in_waiting) if self._serial.in_waiting else b''
-        if response != b'\x10':
+        response = self._serial.read(1)
+        if response != DLE:
             return THZResponse(
                 success=False,
                 error_message=f"Step 0 failed: expected 10, got {response.hex() if response else 'NONE'}"
             )
         
-        # Step 1: Send command
-        self._serial.write(bytes.fromhex(cmd))
+        # Step 1: Send command, expect DLE STX (some firmwares send STX only)
+        self._serial.write(frame)
         self._serial.flush()
-        time.sleep(0.2)
         
-        response = self._serial.read(self._serial.in_waiting) if self._serial.in_waiting else b''
-        if response not in [b'\x10\x02', b'\x02', b'\x10']:
+        response = self._serial.read(1)
+        if response == DLE:
+            response += self._serial.read(1)  # Read the 02
+        elif response != STX:
             return THZResponse(
                 success=False,
                 error_message=f"Step 1 failed: expected 1002, got {response.hex() if response else 'NONE'}"
             )
         
-        if response == b'\x10':
-            time.sleep(0.05)
-            self._serial.read(1)  # Read the 02
-        
         # Step 2: Send DLE
-        self._serial.write(bytes.fromhex("10"))
+        self._serial.write(DLE)
         self._serial.flush()
         
-        # Read response
-        time.sleep(0.3)
-        data = bytearray()
-        start = time.time()
-        while time.time() - start < 2.0:
-            if self._serial.in_waiting:
-                chunk = self._serial.read(self._serial.in_waiting)
-                data.extend(chunk)
-                data_hex = data.hex().upper()
-                if data_hex.startswith("01") and data_hex.endswith("1003"):
-                    break
-            time.sleep(0.01)
+        # Read response; read_until returns at the first 10 03 (or on the
+        # port timeout), so keep reading while that was escaped payload.
+        # Later reads only get the time left, so the whole frame stays
+        # within one timeout.
+        deadline = time.monotonic() + self.timeout
+        data = self._serial.read_until(FOOTER)
+        if footer_escaped(data):
+            try:
+                while footer_escaped(data):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._serial.timeout = remaining
+                    data += self._serial.read_until(FOOTER)
+            finally:
+                self._serial.timeout = self.timeout
         
         # Send final DLE
-        self._serial.write(bytes.fromhex("10"))
+        self._serial.write(DLE)
         self._serial.flush()
         
         if not data:
             return THZResponse(success=False, error_message="No response data")
         
-        return parse_response(data.hex())
-    
+        return decode_response(data, check=self.verify_checksums)
+
+    def read_registers(self, registers: list[str]) -> dict[str, THZResponse]:
+        """
+        Read several registers in one pass over the open connection.
+
+        The heat pump only answers one request at a time, so the registers
+        are still queried sequentially, but callers can fetch a whole poll
+        cycle with a single call (e.g. one executor job in Home Assistant).
+
+        Args:
+            registers: Register addresses as hex strings
+
+        Returns:
+            Dict mapping each register to its THZResponse
+        """
+        return {register: self.send_command(register) for register in registers}
+
     def read_register(self, register: str) -> dict[str, Any]:
         """
         Read and parse a register.
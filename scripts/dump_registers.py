@@ -6,12 +6,13 @@ This script reads all available registers from the heat pump and saves
 them as a JSON file for testing and development purposes.
 
 Usage:
-    python scripts/dump_registers.py [--port /dev/ttyUSB1] [--output registers.json]
+    python scripts/dump_registers.py [--port /dev/ttyUSB1] [--output registers.json] [--compress]
 
 The output file can be used in unit tests to verify parser implementations
 with real device data.
 """
 import argparse
+import gzip
 import json
 import sys
 from datetime import datetime
@@ -22,10 +23,32 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "custom_components" / "has
 
 from thz_protocol import THZConnection, REGISTERS, PARSERS, parse_firmware
 
+try:
+    import orjson
+except ImportError:  # optional, falls back to the stdlib encoder
+    orjson = None
 
-def dump_registers(port: str, baudrate: int = 115200) -> dict:
+
+def encode_json(data: dict, compact: bool = False) -> bytes:
+    """Serialize a register dump as UTF-8 JSON, indented unless compact."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if not compact:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    # Dumps are ASCII in practice; anything else is \u-escaped, still valid JSON
+    if compact:
+        return json.dumps(data, separators=(",", ":")).encode("ascii")
+    return json.dumps(data, indent=2).encode("ascii")
+
+
+def dump_registers(
+    port: str, baudrate: int = 115200, timestamp: datetime | None = None
+) -> dict:
     """
     Read all registers from the heat pump.
+
+    timestamp is recorded in the metadata (default: now).
     
     Returns a dict with:
     - metadata: timestamp, firmware, port
@@ -34,7 +57,7 @@ def dump_registers(port: str, baudrate: int = 115200) -> dict:
     """
     result = {
         "metadata": {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": (timestamp or datetime.now()).isoformat(),
             "port": port,
             "baudrate": baudrate,
         },
@@ -61,17 +84,16 @@ def dump_registers(port: str, baudrate: int = 115200) -> dict:
         else:
             print(f"  Failed: {response.error_message}")
         
-        # Read all other registers
-        for reg_id, reg_info in REGISTERS.items():
-            if reg_id == "FD":
-                continue  # Already read
-                
+        # Read all other registers in one pass (FD was already read)
+        reg_ids = [reg_id for reg_id in REGISTERS if reg_id != "FD"]
+        print(f"Reading {len(reg_ids)} registers...")
+        responses = conn.read_registers(reg_ids)
+
+        for reg_id, response in responses.items():
+            reg_info = REGISTERS[reg_id]
             reg_name = reg_info.get("name", reg_id)
-            print(f"Reading {reg_name} ({reg_id})...")
-            
-            # Use send_command to get raw THZResponse
-            response = conn.send_command(reg_id)
-            
+            print(f"{reg_name} ({reg_id}):")
+
             if response.success and response.data:
                 result["raw"][reg_id] = response.data
                 
@@ -120,29 +142,43 @@ def main():
         default=None,
         help="Output JSON file (default: tests/fixtures/registers_<timestamp>.json)"
     )
+    parser.add_argument(
+        "--compress", "-z",
+        action="store_true",
+        help="Write compact gzip-compressed JSON (.json.gz) instead"
+    )
     
     args = parser.parse_args()
+    now = datetime.now()
     
     # Generate output filename if not specified
     if args.output is None:
         fixtures_dir = Path(__file__).parent.parent / "tests" / "fixtures"
         fixtures_dir.mkdir(parents=True, exist_ok=True)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_path = fixtures_dir / f"registers_{timestamp}.json"
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+        suffix = ".json.gz" if args.compress else ".json"
+        output_path = fixtures_dir / f"registers_{timestamp}{suffix}"
     else:
         output_path = Path(args.output)
         output_path.parent.mkdir(parents=True, exist_ok=True)
     
     # Dump registers
     try:
-        data = dump_registers(args.port, args.baudrate)
+        data = dump_registers(args.port, args.baudrate, now)
     except Exception as e:
         print(f"\nError: {e}")
         sys.exit(1)
     
     # Save to file
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    if args.compress:
+        # Register dumps are highly repetitive; the fastest level already
+        # shrinks them several times over
+        payload = gzip.compress(encode_json(data, compact=True), compresslevel=1)
+    else:
+        payload = encode_json(data)
+
+    # The whole dump is encoded in memory and written with one call
+    output_path.write_bytes(payload)
     
     print(f"\nSaved to: {output_path}")
     print(f"Registers read: {len([r for r in data['raw'].values() if r])}")
@@ -0,0 +1,37 @@
+"""
+Tests for the THZ options flow.
+
+These need Home Assistant and pytest-homeassistant-custom-component.
+"""
+import pytest
+
+pytest.importorskip("pytest_homeassistant_custom_component")
+
+from homeassistant.data_entry_flow import FlowResultType
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.hass_thz.const import (
+    CONF_FIRMWARE_VERSION,
+    CONF_SERIAL_PORT,
+    CONF_VERIFY_CHECKSUMS,
+    DOMAIN,
+)
+
+
+async def test_options_flow_sets_verify_checksums(hass, enable_custom_integrations):
+    """Test the options flow stores the checksum option."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_SERIAL_PORT: "/dev/ttyUSB0", CONF_FIRMWARE_VERSION: "7.02"},
+    )
+    entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    assert result["type"] == FlowResultType.FORM
+    assert result["step_id"] == "init"
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {CONF_VERIFY_CHECKSUMS: True}
+    )
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    assert entry.options == {CONF_VERIFY_CHECKSUMS: True}
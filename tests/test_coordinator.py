@@ -0,0 +1,167 @@
+"""
+Tests for the THZ data update coordinator.
+
+These need Home Assistant and pytest-homeassistant-custom-component; the
+serial connection is replaced with a mock answering from the register
+fixture.
+"""
+import json
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+pytest.importorskip("pytest_homeassistant_custom_component")
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.hass_thz.const import (
+    CONF_FIRMWARE_VERSION,
+    CONF_SERIAL_PORT,
+    CONF_VERIFY_CHECKSUMS,
+    DOMAIN,
+)
+from custom_components.hass_thz.coordinator import THZDataUpdateCoordinator
+from custom_components.hass_thz.thz_protocol import THZResponse
+
+FIXTURE = Path(__file__).parent / "fixtures" / "registers_20251205_212345.json"
+RAW = json.loads(FIXTURE.read_text())["raw"]
+
+COORDINATOR_TIME = "custom_components.hass_thz.coordinator.time"
+
+
+def _respond(registers):
+    """Answer a read_registers call from the fixture."""
+    return {reg: THZResponse(success=True, data=RAW[reg]) for reg in registers}
+
+
+@pytest.fixture
+def coordinator(hass):
+    """Coordinator with a mocked, connected serial link."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_SERIAL_PORT: "/dev/ttyUSB0", CONF_FIRMWARE_VERSION: "7.02"},
+    )
+    coordinator = THZDataUpdateCoordinator(hass, entry)
+    connection = MagicMock()
+    connection.is_connected.return_value = True
+    connection.read_registers.side_effect = _respond
+    coordinator._connection = connection
+    return coordinator
+
+
+def _read_at(coordinator, now, wanted=None):
+    """Run one poll at monotonic time now; return the registers read."""
+    with patch(COORDINATOR_TIME) as mock_time:
+        mock_time.monotonic.return_value = now
+        coordinator._fetch_data(wanted)
+    return set(coordinator._connection.read_registers.call_args.args[0])
+
+
+async def test_schedule_reads_each_register_on_its_interval(coordinator):
+    """Test the staggered schedule tolerates ticks starting a little early."""
+    # The first poll runs late; every later tick starts slightly earlier
+    # than one interval after it
+    assert _read_at(coordinator, 0.3) == {"FB", "F4", "09", "D1"}
+    assert _read_at(coordinator, 60.1) == {"FB", "F4"}
+    assert _read_at(coordinator, 120.2) == {"FB", "F4"}
+    assert _read_at(coordinator, 180.0) == {"FB", "F4"}
+    assert _read_at(coordinator, 240.1) == {"FB", "F4"}
+    assert _read_at(coordinator, 300.2) == {"FB", "F4", "D1"}
+    assert _read_at(coordinator, 360.1) == {"FB", "F4"}
+    assert _read_at(coordinator, 600.1) == {"FB", "F4", "09", "D1"}
+
+
+async def test_schedule_keeps_slow_registers_between_reads(coordinator):
+    """Test values of registers not due are kept from their last read."""
+    _read_at(coordinator, 0.0)
+    with patch(COORDINATOR_TIME) as mock_time:
+        mock_time.monotonic.return_value = 60.0
+        data = coordinator._fetch_data(None)
+
+    assert "compressorHeatingHours" in data  # 09, read at 0
+    assert "outsideTemp" in data  # FB, read again
+
+
+async def test_reads_filtered_by_wanted_registers(coordinator):
+    """Test only the wanted registers are read."""
+    assert _read_at(coordinator, 0.0, {"FB"}) == {"FB"}
+    # Registers not read yet stay due for the next poll
+    assert _read_at(coordinator, 60.0) == {"FB", "F4", "09", "D1"}
+
+
+async def test_refresh_reads_registers_of_entity_contexts(coordinator):
+    """Test a refresh only reads the registers listeners subscribed to."""
+    unsub = coordinator.async_add_listener(MagicMock(), context="F4")
+    try:
+        await coordinator.async_refresh()
+    finally:
+        unsub()
+
+    assert coordinator.last_update_success
+    assert set(coordinator._connection.read_registers.call_args.args[0]) == {"F4"}
+    assert coordinator.register_for_key("heatTemp") == "F4"
+    assert "outsideTemp" not in coordinator.available_keys
+
+
+async def test_failed_register_is_retried(coordinator):
+    """Test a register that failed to read is dropped and read again."""
+    def respond(registers):
+        responses = _respond(registers)
+        responses["09"] = THZResponse(success=False, error_message="No response data")
+        return responses
+
+    # 09 is read fine first, then fails when it is due again
+    _read_at(coordinator, 0.0)
+    coordinator._connection.read_registers.side_effect = respond
+    with patch(COORDINATOR_TIME) as mock_time:
+        mock_time.monotonic.return_value = 600.0
+        await coordinator.async_refresh()
+
+    assert coordinator.last_update_success
+    assert "compressorHeatingHours" not in coordinator.data
+    assert "compressorHeatingHours" not in coordinator.available_keys
+    assert "outsideTemp" in coordinator.available_keys
+
+    coordinator._connection.read_registers.side_effect = _respond
+    assert _read_at(coordinator, 660.0) == {"FB", "F4", "09"}
+    assert _read_at(coordinator, 720.0) == {"FB", "F4"}
+
+
+async def test_unchanged_data_does_not_notify_listeners(coordinator):
+    """Test listeners are only called when a refresh changes the data."""
+    listener = MagicMock()
+    unsub = coordinator.async_add_listener(listener)
+    try:
+        await coordinator.async_refresh()
+        assert listener.call_count == 1
+
+        # Nothing is due yet, so the data is the same
+        await coordinator.async_refresh()
+        assert listener.call_count == 1
+
+        # outsideTemp 4.2 -> 4.3
+        changed = RAW["FB"].replace("FBFDA8002A", "FBFDA8002B", 1)
+        coordinator._connection.read_registers.side_effect = lambda registers: {
+            reg: THZResponse(success=True, data=changed if reg == "FB" else RAW[reg])
+            for reg in registers
+        }
+        coordinator._next_due = dict.fromkeys(coordinator._next_due, 0.0)
+        await coordinator.async_refresh()
+        assert listener.call_count == 2
+        assert coordinator.data["outsideTemp"] == 4.3
+    finally:
+        unsub()
+
+
+async def test_verify_checksums_option(hass):
+    """Test the checksum option is passed to the connection."""
+    for options, expected in (({}, False), ({CONF_VERIFY_CHECKSUMS: True}, True)):
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            data={CONF_SERIAL_PORT: "/dev/ttyUSB0", CONF_FIRMWARE_VERSION: "7.02"},
+            options=options,
+        )
+        coordinator = THZDataUpdateCoordinator(hass, entry)
+
+        assert coordinator.connection.verify_checksums is expected
@@ -0,0 +1,119 @@
+"""
+Tests for the THZ sensor and binary sensor entities.
+
+These need Home Assistant and pytest-homeassistant-custom-component; the
+coordinator is refreshed from a mocked serial link answering from the
+register fixture.
+"""
+import json
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+pytest.importorskip("pytest_homeassistant_custom_component")
+
+from homeassistant.components.binary_sensor import BinarySensorEntityDescription
+from homeassistant.components.sensor import SensorEntityDescription
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.hass_thz.binary_sensor import BINARY_SENSORS, THZBinarySensor
+from custom_components.hass_thz.const import (
+    CONF_FIRMWARE_VERSION,
+    CONF_SERIAL_PORT,
+    DOMAIN,
+)
+from custom_components.hass_thz.coordinator import THZDataUpdateCoordinator
+from custom_components.hass_thz.sensor import _SENSOR_BY_KEY, THZSensor
+from custom_components.hass_thz.thz_protocol import THZResponse
+
+FIXTURE = Path(__file__).parent / "fixtures" / "registers_20251205_212345.json"
+RAW = json.loads(FIXTURE.read_text())["raw"]
+
+_BINARY_BY_KEY = {description.key: description for description in BINARY_SENSORS}
+
+
+@pytest.fixture
+async def coordinator(hass):
+    """Coordinator refreshed once from the register fixture."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={CONF_SERIAL_PORT: "/dev/ttyUSB0", CONF_FIRMWARE_VERSION: "7.02"},
+    )
+    coordinator = THZDataUpdateCoordinator(hass, entry)
+    connection = MagicMock()
+    connection.is_connected.return_value = True
+    connection.read_registers.side_effect = lambda registers: {
+        reg: THZResponse(success=True, data=RAW[reg]) for reg in registers
+    }
+    coordinator._connection = connection
+    await coordinator.async_refresh()
+    return coordinator
+
+
+async def test_sensor_available(coordinator):
+    """Test a sensor with data is available and subscribed to its register."""
+    sensor = THZSensor(coordinator, _SENSOR_BY_KEY["outsideTemp"])
+
+    assert sensor.available is True
+    assert sensor.native_value == 4.2
+    assert sensor.coordinator_context == "FB"
+
+
+async def test_sensor_unavailable_without_key(coordinator):
+    """Test a sensor whose key is missing from the data is unavailable."""
+    sensor = THZSensor(coordinator, SensorEntityDescription(key="missingKey"))
+
+    assert sensor.available is False
+    assert sensor.native_value is None
+
+
+async def test_sensor_unavailable_after_failed_update(coordinator):
+    """Test a sensor becomes unavailable when an update fails."""
+    sensor = THZSensor(coordinator, _SENSOR_BY_KEY["outsideTemp"])
+
+    coordinator.last_update_success = False
+    sensor._update_from_data()
+
+    assert sensor.available is False
+
+
+async def test_binary_sensor_available(coordinator):
+    """Test a binary sensor with data is available and converted to bool."""
+    valve = THZBinarySensor(coordinator, _BINARY_BY_KEY["heatPipeValve"])
+    pump = THZBinarySensor(coordinator, _BINARY_BY_KEY["dhwPump"])
+
+    assert valve.available is True
+    assert valve.is_on is True
+    assert valve.coordinator_context == "FB"
+    assert pump.available is True
+    assert pump.is_on is False
+
+
+async def test_inside_temp_valid_binary_sensor(coordinator):
+    """Test the inside sensor validity flag is emitted and available."""
+    sensor = THZBinarySensor(coordinator, _BINARY_BY_KEY["insideTempValid"])
+
+    # The fixture pump has no inside temperature sensor (0xFDA8)
+    assert sensor.available is True
+    assert sensor.is_on is False
+
+
+async def test_binary_sensor_unavailable_without_key(coordinator):
+    """Test a binary sensor whose key is missing from the data is unavailable."""
+    sensor = THZBinarySensor(
+        coordinator, BinarySensorEntityDescription(key="missingKey")
+    )
+
+    assert sensor.available is False
+    assert sensor.is_on is None
+
+
+async def test_binary_sensor_unavailable_after_failed_update(coordinator):
+    """Test a binary sensor becomes unavailable when an update fails."""
+    sensor = THZBinarySensor(coordinator, _BINARY_BY_KEY["compressor"])
+
+    coordinator.last_update_success = False
+    sensor._update_from_data()
+
+    assert sensor.available is False
@@ -192,6 +192,21 @@ class TestLiveRegisterScan:
         assert results["FB"]["success"], "sGlobal read failed"
 
 
+class TestLiveChecksum:
+    """Tests that verify response checksums on real frames."""
+    
+    @pytest.mark.parametrize("register", ["FD", "FB", "F4"])
+    def test_response_checksum(self, thz_connection, register):
+        """Test real responses pass checksum verification."""
+        thz_connection.verify_checksums = True
+        try:
+            response = thz_connection.send_command(register)
+        finally:
+            thz_connection.verify_checksums = False
+        
+        assert response.success, f"Failed: {response.error_message}"
+
+
 class TestLiveDataValidation:
     """Tests that validate data consistency."""
     
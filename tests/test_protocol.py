@@ -14,9 +14,15 @@ from thz_protocol import (
     PARSERS,
     # Core functions
     calculate_checksum,
+    escape_bytes,
+    footer_escaped,
     escape_data,
+    unescape_bytes,
     unescape_data,
+    verify_checksum,
     build_command,
+    decode_response,
+    encode_command,
     parse_response,
     parse_temp,
     # Parser functions
@@ -236,6 +242,16 @@ class TestEscaping:
         unescaped = unescape_data(escaped)
         assert unescaped == original
     
+    def test_escape_bytes_aligned(self):
+        """Test that only whole 0x10 bytes are escaped, not nibble pairs."""
+        assert escape_bytes(b"\x01\x02") == b"\x01\x02"  # hex "0102"
+        assert escape_data("0102") == "0102"
+    
+    def test_bytes_roundtrip(self):
+        """Test escape_bytes/unescape_bytes roundtrip."""
+        original = b"\x10\x2B\x18\x10\x10\xFF"
+        assert unescape_bytes(escape_bytes(original)) == original
+    
     def test_roundtrip_no_special(self):
         """Test roundtrip with no special bytes."""
         original = "AABBCCDD"
@@ -285,6 +301,17 @@ class TestBuildCommand:
         assert cmd.startswith("0100")  # Header
         assert cmd.endswith("1003")    # Footer
     
+    def test_encode_command_is_cached(self):
+        """Test that frames are encoded once per register."""
+        for reg in REGISTERS:
+            assert encode_command(reg) is encode_command(reg)
+    
+    def test_encode_command_matches_build_command(self):
+        """Test that the bytes frame is the hex command decoded."""
+        for reg in ["FD", "0F", "1000", "2B", "0A17"]:
+            assert encode_command(reg) == bytes.fromhex(build_command(reg))
+        assert encode_command("2B") == b"\x01\x00\x2C\x2B\x18\x10\x03"
+    
     def test_build_long_register(self):
         """Test building command with 4-char register."""
         cmd = build_command("0A17")
@@ -360,6 +387,31 @@ class TestParseResponse:
         response = parse_response("0100fefd0702001003")
         assert response.success is True
     
+    def test_decode_response_bytes(self):
+        """Test decoding a raw escaped frame."""
+        response = decode_response(bytearray.fromhex("0100AAFD10102B181003"))
+        assert response.success is True
+        assert response.data == "FD102B"
+    
+    def test_decode_response_unknown_header(self):
+        """Test that the unknown header is reported as hex."""
+        response = decode_response(b"\x01\x99\xAA\x10\x03")
+        assert response.error_message == "Unknown header: 0199"
+    
+    def test_verify_checksum(self):
+        """Test checksum verification of an unescaped frame."""
+        # 01 + 00 + FD + 02 + BE = 0x1BE -> BE
+        assert verify_checksum(bytes.fromhex("0100BEFD02BE1003"))
+        assert not verify_checksum(bytes.fromhex("0100BFFD02BE1003"))
+    
+    def test_decode_response_checksum_mismatch(self):
+        """Test that a corrupted frame is rejected when checking."""
+        frame = bytes.fromhex("0100BFFD02BE1003")
+        assert decode_response(frame).success is True
+        response = decode_response(frame, check=True)
+        assert response.success is False
+        assert response.error == THZError.CRC_ERROR
+    
     def test_parse_extracts_data_correctly(self):
         """Test that data extraction removes header, checksum, and footer."""
         # 0100 (header) + FE (checksum) + AABBCCDD (data) + 1003 (footer)
@@ -407,6 +459,12 @@ class TestParseTemp:
         """Test boundary between positive and negative."""
         assert parse_temp("7FFF") == 3276.7  # Max positive
         assert parse_temp("8000") == -3276.8  # Min negative (signed)
+    
+    def test_parse_short_and_long_input(self):
+        """Test values that are not 4 hex characters are still parsed."""
+        assert parse_temp("C8") == 20.0
+        assert parse_temp("000000C8") == 20.0
+        assert parse_temp("FFEC") == parse_temp("00FFEC")
 
 
 # =============================================================================
@@ -485,12 +543,14 @@ class TestParseSglobal:
         result = parse_sglobal(data)
         # insideTemp with -60.0 is filtered out (sensor not connected)
         assert "insideTemp" not in result
+        assert result["insideTempValid"] is False
     
     def test_parse_sglobal_valid_inside(self):
         """Test valid inside temperature."""
         data = "FB" + "0000" * 7 + "00D7" + "0000" * 2  # 21.5°C
         result = parse_sglobal(data)
         assert result["insideTemp"] == 21.5
+        assert result["insideTempValid"] is True
     
     def test_parse_sglobal_short_data(self):
         """Test parsing with minimal data."""
@@ -504,6 +564,20 @@ class TestParseSglobal:
         result = parse_sglobal("FB")
         assert "collectorTemp" not in result
     
+    def test_parse_sglobal_status_flags(self):
+        """Test decoding status bits at positions 40-45."""
+        # pos 40 = 0x02 (mixer open), 42 = 0x02 (DHW pump), 44 = 0x17
+        data = "FB" + "0000" * 10 + "02" + "02" + "17" + "00"
+        result = parse_sglobal(data)
+        assert result["compressor"] is True
+        assert result["boosterStage1"] is True
+        assert result["boosterStage2"] is True
+        assert result["boosterStage3"] is False
+        assert result["dhwPump"] is True
+        assert result["heatingCircuitPump"] is False
+        assert result["mixerOpen"] is True
+        assert result["mixerClosed"] is False
+    
     def test_parse_sglobal_ventilator_power(self):
         """Test parsing ventilator power at position 72-73."""
         # mainVentilatorPower is at position 72-73 (chars 72-73 after FB prefix)
@@ -555,6 +629,14 @@ class TestParseShc1:
         result = parse_shc1(data)
         assert result["onOffCycles"] == 23
     
+    def test_parse_shc1_hysteresis(self):
+        """Test parsing single-byte hysteresis numbers."""
+        data = "F4" + "0000" * 8 + "02" + "01"  # pos 32-33 = 2, pos 34-35 = 1
+        result = parse_shc1(data)
+        assert result["onHysteresisNo"] == 2
+        assert result["offHysteresisNo"] == 1
+        assert "roomSetTemp" not in result
+    
     def test_parse_shc1_short(self):
         """Test parsing with minimal data - only outsideTemp at pos 0-3."""
         data = "F4" + "00C8"  # F4 + outsideTemp=20.0 at pos 0-3
@@ -836,6 +918,7 @@ class TestTHZConnection:
         assert conn.baudrate == 57600
         assert conn.timeout == 3.0
         assert conn.write_timeout == 2.0
+        assert conn.verify_checksums is False
         assert conn._serial is None
     
     def test_init_defaults(self):
@@ -923,6 +1006,98 @@ class TestTHZConnection:
         assert response.success is False
         assert "Step 0 failed" in response.error_message
     
+    @patch('thz_protocol.serial.Serial')
+    def test_send_command_reads_past_escaped_footer(self, mock_serial_class):
+        """Test a payload 10 03 does not end the response early."""
+        mock_serial = MagicMock()
+        mock_serial.read.side_effect = [b'\x10', b'\x10', b'\x02']
+        # Data 10 03 is sent as 10 10 03; the checksum is 01+00+FB+10+03
+        mock_serial.read_until.side_effect = [
+            b'\x01\x00\x0F\xFB\x10\x10\x03',
+            b'\x10\x03',
+        ]
+        mock_serial_class.return_value = mock_serial
+        
+        conn = THZConnection("/dev/ttyUSB0")
+        conn.connect()
+        response = conn.send_command("FB")
+        
+        assert response.success is True
+        assert response.data == "FB1003"
+        assert mock_serial.read_until.call_count == 2
+        # The port timeout is restored after the shortened second read
+        assert mock_serial.timeout == conn.timeout
+    
+    @patch('thz_protocol.serial.Serial')
+    @patch('thz_protocol.time.monotonic')
+    def test_send_command_escaped_footer_read_bounded(self, mock_monotonic, mock_serial_class):
+        """Test reads after an escaped footer only get the time left."""
+        mock_serial = MagicMock()
+        mock_serial.read.side_effect = [b'\x10', b'\x10', b'\x02']
+        timeouts = []
+        
+        def read_until(terminator):
+            timeouts.append(mock_serial.timeout)
+            return b'\x01\x00\x0F\xFB\x10\x10\x03'
+        
+        mock_serial.read_until.side_effect = read_until
+        mock_serial_class.return_value = mock_serial
+        # Deadline at 3.0; the reads after the first start at 1.0 and 2.5
+        mock_monotonic.side_effect = [0.0, 1.0, 2.5, 3.5]
+        
+        conn = THZConnection("/dev/ttyUSB0")
+        conn.connect()
+        mock_serial.timeout = conn.timeout
+        conn.send_command("FB")
+        
+        assert timeouts == [3.0, 2.0, 0.5]
+        assert mock_serial.timeout == 3.0
+    
+    @patch('thz_protocol.serial.Serial')
+    def test_send_command_checksum_opt_in(self, mock_serial_class):
+        """Test the response checksum is only checked when enabled."""
+        mock_serial = MagicMock()
+        mock_serial_class.return_value = mock_serial
+        
+        for verify, success in ((False, True), (True, False)):
+            mock_serial.read.side_effect = [b'\x10', b'\x10', b'\x02']
+            # Checksum should be 01+00+FB+C8 = C4
+            mock_serial.read_until.side_effect = [b'\x01\x00\x00\xFB\xC8\x10\x03']
+            
+            conn = THZConnection("/dev/ttyUSB0", verify_checksums=verify)
+            conn.connect()
+            response = conn.send_command("FB")
+            
+            assert response.success is success
+    
+    def test_footer_escaped(self):
+        """Test detection of an escaped 10 03 at the end of the data."""
+        assert footer_escaped(b'\x01\x00\x0F\xFB\x10\x10\x03') is True
+        assert footer_escaped(b'\x01\x00\x0F\xFB\x10\x10\x10\x03') is False
+        assert footer_escaped(b'\x01\x00\x0F\xFB\x10\x03') is False
+        assert footer_escaped(b'\x01\x00') is False
+    
+    def test_read_registers_returns_response_per_register(self):
+        """Test read_registers queries each register and keys the responses."""
+        conn = THZConnection("/dev/ttyUSB0")
+        responses = {
+            "FB": THZResponse(success=True, data="FB00C8"),
+            "09": THZResponse(success=False, error_message="No response data"),
+        }
+        with patch.object(conn, "send_command", side_effect=responses.get) as mock_send:
+            result = conn.read_registers(["FB", "09"])
+
+        assert result == responses
+        assert [c.args[0] for c in mock_send.call_args_list] == ["FB", "09"]
+
+    def test_read_registers_not_connected(self):
+        """Test read_registers when not connected."""
+        conn = THZConnection("/dev/ttyUSB0")
+        result = conn.read_registers(["FB", "F4"])
+
+        assert set(result) == {"FB", "F4"}
+        assert all(not r.success for r in result.values())
+
     def test_read_register_not_connected(self):
         """Test read_register when not connected."""
         conn = THZConnection("/dev/ttyUSB0")